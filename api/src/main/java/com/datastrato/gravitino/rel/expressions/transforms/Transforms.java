@@ -18,6 +18,10 @@ import java.util.Objects;
 public class Transforms {
   /** An empty array of transforms. */
   public static final Transform[] EMPTY_TRANSFORM = new Transform[0];
+
+  private static final ListPartition[] EMPTY_LIST_PARTITIONS = new ListPartition[0];
+  private static final RangePartition[] EMPTY_RANGE_PARTITIONS = new RangePartition[0];
+
   /** The name of the identity transform. */
   public static final String NAME_OF_IDENTITY = "identity";
   /** The name of the year transform. The year transform returns the year of the input value. */
@@ -168,7 +172,7 @@ public class Transforms {
    * @return The created transform
    */
   public static ListTransform list(String[]... fieldNames) {
-    return list(fieldNames, new ListPartition[0]);
+    return list(fieldNames, EMPTY_LIST_PARTITIONS);
   }
 
   /**
@@ -191,7 +195,7 @@ public class Transforms {
    * @return The created transform
    */
   public static RangeTransform range(String[] fieldName) {
-    return range(fieldName, new RangePartition[0]);
+    return range(fieldName, EMPTY_RANGE_PARTITIONS);
   }
 
   /**
@@ -515,7 +519,7 @@ public class Transforms {
 
     private ListTransform(NamedReference[] fields) {
       this.fields = fields;
-      this.assignments = new ListPartition[0];
+      this.assignments = EMPTY_LIST_PARTITIONS;
     }
 
     private ListTransform(NamedReference[] fields, ListPartition[] assignments) {
@@ -572,7 +576,7 @@ public class Transforms {
 
     private RangeTransform(NamedReference field) {
       this.field = field;
-      this.assignments = new RangePartition[0];
+      this.assignments = EMPTY_RANGE_PARTITIONS;
     }
 
     private RangeTransform(NamedReference field, RangePartition[] assignments) {
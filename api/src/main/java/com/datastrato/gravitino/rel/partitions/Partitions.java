@@ -13,7 +13,7 @@ import java.util.Objects;
 public class Partitions {
 
   /** An empty array of partitions. */
-  public static Partition[] EMPTY_PARTITIONS = new Partition[0];
+  public static final Partition[] EMPTY_PARTITIONS = new Partition[0];
 
   /**
    * Creates a range partition.
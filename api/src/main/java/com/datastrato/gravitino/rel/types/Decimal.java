@@ -24,6 +24,8 @@ public class Decimal {
   private final BigDecimal value;
   private final int precision;
   private final int scale;
+  // Cached hash code, computed lazily since all the fields above are immutable.
+  private int hash;
 
   /**
    * Creates a decimal value with the given value, precision and scale.
@@ -69,6 +71,19 @@ public class Decimal {
     return of(new BigDecimal(value), precision, scale);
   }
 
+  /**
+   * Creates a decimal value from an unscaled integer value, precision and scale. The value of the
+   * decimal is {@code unscaledValue * 10^-scale}, so no rounding is needed.
+   *
+   * @param unscaledValue The unscaled value of the decimal.
+   * @param precision The precision of the decimal.
+   * @param scale The scale of the decimal.
+   * @return A new {@link Decimal} instance.
+   */
+  public static Decimal ofUnscaled(long unscaledValue, int precision, int scale) {
+    return of(BigDecimal.valueOf(unscaledValue, scale), precision, scale);
+  }
+
   /** @return The value of the decimal. */
   public BigDecimal value() {
     return value;
@@ -119,6 +134,11 @@ public class Decimal {
 
   @Override
   public int hashCode() {
-    return Objects.hash(value, precision, scale);
+    int h = hash;
+    if (h == 0) {
+      h = Objects.hash(value, precision, scale);
+      hash = h;
+    }
+    return h;
   }
 }
@@ -81,5 +81,12 @@ public class TestLiteral {
     literal = decimalLiteral(Decimal.of("0.00"));
     Assertions.assertEquals(Decimal.of(new BigDecimal("0.00")), literal.value());
     Assertions.assertEquals(Types.DecimalType.of(2, 2), literal.dataType());
+
+    Decimal decimal = Decimal.ofUnscaled(12345, 10, 2);
+    Assertions.assertEquals(Decimal.of("123.45", 10, 2), decimal);
+    Assertions.assertEquals(new BigDecimal("123.45"), decimal.value());
+    Assertions.assertEquals(10, decimal.precision());
+    Assertions.assertEquals(2, decimal.scale());
+    Assertions.assertThrows(IllegalArgumentException.class, () -> Decimal.ofUnscaled(12345, 4, 2));
   }
 }